@@ -5,24 +5,61 @@ Loads JSON data from data/, computes metrics, and renders an interactive
 HTML dashboard using Plotly.js for charts and vanilla JS for filtering.
 """
 
+import gzip
 import json
+import math
 import os
-from datetime import datetime, timezone
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(SCRIPT_DIR, "data")
 PAGES_DIR = os.path.join(SCRIPT_DIR, "pages")
 OUTPUT_PATH = os.path.join(PAGES_DIR, "index.html")
 
+# Raw timestamp -> Unix seconds. Events in the same block share a
+# timestamp, and every event list is converted on each build.
+_epoch_cache: dict[str, int | None] = {}
+
+# Dashboard bucket granularities, in the order of each row's "pkeys" list
+PERIODS = ("day", "week", "month", "quarter")
+_UNKNOWN_PERIOD_KEYS = ["unknown"] * len(PERIODS)
+_period_keys_cache: dict[str, list[str]] = {}
+
 
-def load_json(filename: str) -> list | dict:
+def _load_json(filename: str, empty: list | dict) -> list | dict:
     path = os.path.join(DATA_DIR, filename)
-    if not os.path.exists(path):
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         print(f"  Warning: {path} not found, returning empty")
-        dict_files = ("flyover_lp_info.json", "btc_locked_stats.json", "web_analytics.json", "route_health.json")
-        return {} if filename in dict_files else []
-    with open(path) as f:
-        return json.load(f)
+        return empty
+    # Both parsers take the raw bytes; orjson is several times faster on the event files
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def load_list(filename: str) -> list:
+    """Load an event-list file from DATA_DIR, or [] if it doesn't exist yet."""
+    return _load_json(filename, [])
+
+
+def load_dict(filename: str) -> dict:
+    """Load a stats/info file from DATA_DIR, or {} if it doesn't exist yet."""
+    return _load_json(filename, {})
+
+
+# fromisoformat accepts a trailing "Z" from Python 3.11 on; before that it
+# has to be spelled "+00:00".
+_FROMISOFORMAT_Z = sys.version_info >= (3, 11)
 
 
 def parse_timestamp(ts: str) -> datetime | None:
@@ -30,127 +67,359 @@ def parse_timestamp(ts: str) -> datetime | None:
     if not ts:
         return None
     try:
-        # Blockscout returns ISO format like "2024-01-15T10:30:00.000000Z"
-        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        if not _FROMISOFORMAT_Z and ts[-1] == "Z":
+            ts = ts[:-1] + "+00:00"
+        return datetime.fromisoformat(ts)
     except (ValueError, TypeError):
         return None
 
 
+def epoch_seconds(ts: str) -> int | None:
+    """Return a timestamp as whole Unix seconds, or None if it can't be parsed.
+
+    Naive timestamps are taken as UTC, like period_keys does. The page
+    compares these as plain numbers instead of building a Date per event.
+    """
+    if not ts:
+        return None
+    try:
+        return _epoch_cache[ts]
+    except KeyError:
+        pass
+    parsed = parse_timestamp(ts)
+    if parsed is None:
+        seconds = None
+    else:
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        seconds = int(parsed.timestamp())
+    _epoch_cache[ts] = seconds
+    return seconds
+
+
+def period_keys(ts: str) -> list[str]:
+    """Return the UTC [day, week, month, quarter] bucket keys for a timestamp.
+
+    Keys match what the dashboard groups by: "2025-04-10", "2025-W15"
+    (ISO week), "2025-04" and "2025-Q2".
+    """
+    if not ts:
+        return _UNKNOWN_PERIOD_KEYS
+    if ts.endswith("Z") or ts.endswith("+00:00"):
+        day = ts[:10]
+    else:
+        parsed = parse_timestamp(ts)
+        if parsed is None:
+            return _UNKNOWN_PERIOD_KEYS
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc)
+        day = parsed.date().isoformat()
+    keys = _period_keys_cache.get(day)
+    if keys is None:
+        try:
+            d = date.fromisoformat(day)
+        except ValueError:
+            return _UNKNOWN_PERIOD_KEYS
+        iso_year, iso_week, _ = d.isocalendar()
+        keys = [day, f"{iso_year}-W{iso_week:02d}", day[:7], f"{d.year}-Q{(d.month + 2) // 3}"]
+        _period_keys_cache[day] = keys
+    return keys
+
+
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def period_label(key: str) -> str:
+    """Table label for a bucket key from period_keys.
+
+    "2025-04-10" -> "Apr 10, 2025", "2025-W15" -> "W15 2025",
+    "2025-04" -> "Apr 2025", "2025-Q2" -> "Q2 2025". Anything else is
+    returned unchanged.
+    """
+    year, _, rest = key.partition("-")
+    if rest.startswith(("W", "Q")):
+        return f"{rest} {year}"
+    month, _, day = rest.partition("-")
+    if not month.isdigit() or not 1 <= int(month) <= 12:
+        return key
+    if day:
+        return f"{_MONTH_NAMES[int(month) - 1]} {int(day)}, {year}"
+    return f"{_MONTH_NAMES[int(month) - 1]} {year}"
+
+
+# Amounts are shipped as integer satoshis (1e-8 RBTC): shorter in JSON than
+# full-precision floats, and sums are exact regardless of order.
+SATS_PER_RBTC = 100_000_000
+
+# Per-stream column layout for _project: (value key, source RBTC field, string
+# columns as (output key, source field) pairs). Each stream is emitted as
+# index-aligned columns: tx_hash, timestamp (Unix seconds), the value in
+# integer satoshis under the value key, then the string columns; with
+# with_periods it also carries "pkeys". block_number only orders the rows and
+# isn't emitted.
+EVENT_SCHEMAS = {
+    "flyover_pegins": ("value_sat", "value_rbtc", (("address", "dest_address"), ("lp_address", "from_address"))),
+    "flyover_pegouts": ("value_sat", "amount_rbtc", (("address", "sender"), ("quote_hash", "quote_hash"))),
+    "powpeg_pegins": ("value_sat", "value_rbtc", (("address", "to_address"),)),
+    "powpeg_pegouts": ("value_sat", "value_rbtc", (("address", "from_address"),)),
+    "penalties": ("penalty_sat", "penalty_rbtc", (("lp_address", "lp_address"),)),
+}
+
+
+def to_sats(value) -> int:
+    """Convert an RBTC amount (float or numeric string) to integer satoshis."""
+    return round(float(value) * SATS_PER_RBTC)
+
+
+# lp_info keys the health panel reads; the rest (wallet addresses, per-UTXO
+# detail, fetch time) stays in the data dir for check_alerts/route health.
+LP_INFO_FIELDS = (
+    "lp_name", "pegin_rbtc", "pegout_btc", "lps_pegin_rbtc", "lps_pegout_btc",
+    "btc_utxo_count", "btc_mempool_tx_count",
+)
+# The LP's own RBTC wallet (fetch_flyover.TEKSCAPITAL_RBTC_WALLET), lowercased
+# like event addresses; its events aren't user activity for wallet stats.
+LP_RBTC_WALLET = "0x82a06ebdb97776a2da4041df8f2b2ea8d3257852"
+
+# btc_locked_stats keys the BTC locked panel reads; per-contract detail and
+# fetch bookkeeping aren't shown.
+BTC_LOCKED_FIELDS = ("total_bridged_rbtc", "locked_in_contracts_rbtc", "pct_locked", "contract_count")
+
+
+def _project(
+    events: list[dict], value_key: str, value_src: str, fields: tuple, with_periods: bool = False
+) -> dict[str, list]:
+    """Project raw fetcher events onto the columns the dashboard reads.
+
+    Returns a struct of arrays: one list per output field, index-aligned, so
+    field names aren't repeated per event in the JSON payload. Rows come out
+    in block order (stable, so same-block events keep fetch order); the block
+    number itself is only used for that sort and isn't emitted. Timestamps
+    are emitted as Unix seconds (null if unparseable). With
+    with_periods, "pkeys" holds one bucket-key column per entry in PERIODS for
+    aggregate_periods and wallet_stats to group by.
+    """
+    out_keys = tuple(key for key, _ in fields)
+    src_keys = ("tx_hash", "block_number", "block_timestamp", value_src) + tuple(src for _, src in fields)
+    try:
+        rows = list(map(itemgetter(*src_keys), events))
+    except KeyError:
+        # Older fetcher output can miss optional fields
+        defaults = ("", None, "", 0) + ("",) * len(fields)
+        rows = [tuple(e.get(k, d) for k, d in zip(src_keys, defaults)) for e in events]
+    # Rows with no block number (null or missing) sort last instead of
+    # failing the comparison
+    rows.sort(key=lambda r: (r[1] is None, r[1] or 0))
+    # Transpose rows into columns in one pass; each column is then converted
+    # with a single map() instead of per-event appends.
+    tx_col, _, ts_col, value_col, *extra_cols = zip(*rows) if rows else ((),) * len(src_keys)
+
+    columns = {
+        "tx_hash": list(tx_col),
+        "timestamp": list(map(epoch_seconds, ts_col)),
+        value_key: list(map(to_sats, value_col)),
+    }
+    intern = sys.intern
+    for key, col in zip(out_keys, extra_cols):
+        if key.endswith("address"):
+            # Addresses repeat across events (one LP, returning users); share
+            # one str object per address. Lowercased here so the page can
+            # compare them as-is. tx/quote hashes are unique.
+            columns[key] = [intern(a.lower()) if isinstance(a, str) else a for a in col]
+        else:
+            columns[key] = list(col)
+    if with_periods:
+        keys_by_event = list(map(period_keys, ts_col))
+        columns["pkeys"] = [list(col) for col in zip(*keys_by_event)] if keys_by_event else [[] for _ in PERIODS]
+    return columns
+
+
+def aggregate_periods(streams: dict[str, dict[str, list]]) -> dict:
+    """Per-period tx counts and RBTC volume for each peg stream.
+
+    For every granularity in PERIODS this returns the sorted bucket keys seen
+    across all streams and their display "labels", plus per-stream
+    "count"/"volume" lists aligned with those keys and their
+    "total_count"/"total_volume". Streams must carry "pkeys" columns (see
+    _project); only the day column is read. Volumes are summed in satoshis
+    and converted to RBTC once per bucket.
+    """
+    # Every coarser bucket is a union of days, so events are binned by day
+    # once and the other periods roll the day buckets up
+    daily = {}
+    for name, columns in streams.items():
+        by_day = daily[name] = {}
+        for day, value in zip(columns["pkeys"][0], columns["value_sat"]):
+            if day == "unknown":
+                continue
+            acc = by_day.get(day)
+            if acc is None:
+                acc = by_day[day] = [0, 0]
+            acc[0] += 1
+            acc[1] += value
+
+    aggregates = {}
+    for idx, period in enumerate(PERIODS):
+        if idx == 0:
+            buckets = daily
+        else:
+            buckets = {}
+            for name, by_day in daily.items():
+                by_key = buckets[name] = {}
+                for day, (count, volume) in by_day.items():
+                    key = period_keys(day)[idx]
+                    acc = by_key.get(key)
+                    if acc is None:
+                        acc = by_key[key] = [0, 0]
+                    acc[0] += count
+                    acc[1] += volume
+        keys = sorted(set().union(*buckets.values()))
+        entry = {"keys": keys, "labels": list(map(period_label, keys))}
+        for name, by_key in buckets.items():
+            empty = (0, 0)
+            entry[name] = {
+                "count": [by_key.get(k, empty)[0] for k in keys],
+                "volume": [by_key.get(k, empty)[1] / SATS_PER_RBTC for k in keys],
+                "total_count": sum(acc[0] for acc in by_key.values()),
+                "total_volume": sum(acc[1] for acc in by_key.values()) / SATS_PER_RBTC,
+            }
+        aggregates[period] = entry
+    return aggregates
+
+
+def top_liquidity_provider(pegins: dict[str, list], penalties: dict[str, list]) -> dict:
+    """The LP with the most Flyover peg-in volume, as {"address", "pegins", "penalties"}, or {}.
+
+    Addresses come lowercased from _project; ties go to the first LP seen. LPs that
+    only appear in penalties are still candidates, so one can be reported when
+    there are no peg-ins at all.
+    """
+    stats = {}  # address -> [pegins, pegin_sat, penalties]
+    for addr, value in zip(pegins["lp_address"], pegins["value_sat"]):
+        if addr:
+            entry = stats.setdefault(addr, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += value
+    for addr in penalties["lp_address"]:
+        if addr:
+            stats.setdefault(addr, [0, 0, 0])[2] += 1
+
+    if not stats:
+        return {}
+    # max() keeps the first of equal items, i.e. the first LP seen
+    addr, (count, _, penalty_count) = max(stats.items(), key=lambda item: item[1][1])
+    return {"address": addr, "pegins": count, "penalties": penalty_count}
+
+
+def wallet_stats(flyover: list[dict[str, list]], powpeg: list[dict[str, list]]) -> dict:
+    """Unique/repeat user wallet counts for the wallets panel.
+
+    Takes the Flyover and PowPeg event streams (with "address" and "pkeys"
+    columns) and returns:
+      avg:    {period: {"flyover", "powpeg", "combined"}} -- mean number of
+              distinct wallets per bucket, rounded half up like Math.round
+      unique / repeat: {"flyover", "powpeg", "combined"} -- all-time distinct
+              wallets, and how many of them have 2+ events
+      cross_protocol: wallets seen on both Flyover and PowPeg
+    Empty addresses and the LP's own wallet are not counted.
+    """
+    def is_user(addr):
+        return addr and addr != LP_RBTC_WALLET
+
+    avg = {}
+    for idx, period in enumerate(PERIODS):
+        groups = {"flyover": {}, "powpeg": {}, "combined": {}}
+        for name, streams in (("flyover", flyover), ("powpeg", powpeg)):
+            by_key, combined = groups[name], groups["combined"]
+            for columns in streams:
+                for key, addr in zip(columns["pkeys"][idx], columns["address"]):
+                    if key == "unknown" or not is_user(addr):
+                        continue
+                    by_key.setdefault(key, set()).add(addr)
+                    combined.setdefault(key, set()).add(addr)
+        avg[period] = {
+            name: math.floor(sum(map(len, by_key.values())) / len(by_key) + 0.5) if by_key else 0
+            for name, by_key in groups.items()
+        }
+
+    counts = {}
+    for name, streams in (("flyover", flyover), ("powpeg", powpeg)):
+        counts[name] = Counter(a for columns in streams for a in columns["address"] if is_user(a))
+    counts["combined"] = counts["flyover"] + counts["powpeg"]
+
+    return {
+        "avg": avg,
+        "unique": {name: len(c) for name, c in counts.items()},
+        "repeat": {name: sum(1 for n in c.values() if n > 1) for name, c in counts.items()},
+        "cross_protocol": len(counts["flyover"].keys() & counts["powpeg"].keys()),
+    }
+
+
 def build_dashboard_data(
     flyover_pegins: list[dict],
     flyover_pegouts: list[dict],
     flyover_pegout_refunds: list[dict],
     flyover_penalties: list[dict],
-    flyover_refunds: list[dict],
     powpeg_pegins: list[dict],
     powpeg_pegouts: list[dict],
     lp_info: dict | None = None,
     btc_locked_stats: dict | None = None,
-    web_analytics: dict | None = None,
     route_health: dict | None = None,
 ) -> dict:
-    """Build the full dashboard dataset for embedding in HTML."""
+    """Build the dataset the dashboard page fetches.
 
-    # Flyover peg-ins (CallForUser only — fetcher already filters)
-    fp_pegins = []
-    for e in flyover_pegins:
-        ts = parse_timestamp(e.get("block_timestamp", ""))
-        fp_pegins.append({
-            "tx_hash": e.get("tx_hash", ""),
-            "block": e.get("block_number", 0),
-            "timestamp": ts.isoformat() if ts else "",
-            "value_rbtc": float(e.get("value_rbtc", 0)),
-            "address": e.get("dest_address", ""),
-            "lp_address": e.get("from_address", ""),
-        })
+    Only what the page reads is shipped: penalties and each peg-in's LP
+    address feed top_lp here and are then dropped, peg-out refunds are reduced
+    to a completed-peg-out count, bucket keys and user addresses are reduced
+    to the period aggregates and wallet stats, and user refunds and web
+    analytics, which no section renders, are left out.
+    """
 
+    # Flyover peg-ins (CallForUser only — fetcher already filters)
+    fp_pegins = _project(flyover_pegins, *EVENT_SCHEMAS["flyover_pegins"], with_periods=True)
     # Flyover peg-outs (PegOutDeposit only — fetcher already filters)
-    fp_pegouts = []
-    for e in flyover_pegouts:
-        ts = parse_timestamp(e.get("block_timestamp", ""))
-        fp_pegouts.append({
-            "tx_hash": e.get("tx_hash", ""),
-            "block": e.get("block_number", 0),
-            "timestamp": ts.isoformat() if ts else "",
-            "value_rbtc": float(e.get("amount_rbtc", 0)),
-            "address": e.get("sender", ""),
-            "quote_hash": e.get("quote_hash", ""),
-        })
-
-    # PowPeg peg-ins
-    pp_pegins = []
-    for e in powpeg_pegins:
-        ts = parse_timestamp(e.get("block_timestamp", ""))
-        pp_pegins.append({
-            "tx_hash": e.get("tx_hash", ""),
-            "block": e.get("block_number", 0),
-            "timestamp": ts.isoformat() if ts else "",
-            "value_rbtc": float(e.get("value_rbtc", 0)),
-            "address": e.get("to_address", ""),
-        })
-
-    # PowPeg peg-outs
-    pp_pegouts = []
-    for e in powpeg_pegouts:
-        ts = parse_timestamp(e.get("block_timestamp", ""))
-        pp_pegouts.append({
-            "tx_hash": e.get("tx_hash", ""),
-            "block": e.get("block_number", 0),
-            "timestamp": ts.isoformat() if ts else "",
-            "value_rbtc": float(e.get("value_rbtc", 0)),
-            "address": e.get("from_address", ""),
-        })
-
-    # Penalties
-    penalties = []
-    for e in flyover_penalties:
-        ts = parse_timestamp(e.get("block_timestamp", ""))
-        penalties.append({
-            "tx_hash": e.get("tx_hash", ""),
-            "block": e.get("block_number", 0),
-            "timestamp": ts.isoformat() if ts else "",
-            "lp_address": e.get("lp_address", ""),
-            "penalty_rbtc": float(e.get("penalty_rbtc", 0)),
-            "quote_hash": e.get("quote_hash", ""),
-        })
-
-    # User refunds
-    refunds = []
-    for e in flyover_refunds:
-        ts = parse_timestamp(e.get("block_timestamp", ""))
-        refunds.append({
-            "tx_hash": e.get("tx_hash", ""),
-            "block": e.get("block_number", 0),
-            "timestamp": ts.isoformat() if ts else "",
-            "user_address": e.get("user_address", ""),
-            "value_rbtc": float(e.get("value_rbtc", 0)),
-        })
-
-    # Peg-out refunds (LP claimed BTC delivery)
-    pegout_refund_hashes = set()
-    for e in flyover_pegout_refunds:
-        pegout_refund_hashes.add(e.get("quote_hash", ""))
-
-    return {
+    fp_pegouts = _project(flyover_pegouts, *EVENT_SCHEMAS["flyover_pegouts"], with_periods=True)
+    pp_pegins = _project(powpeg_pegins, *EVENT_SCHEMAS["powpeg_pegins"], with_periods=True)
+    pp_pegouts = _project(powpeg_pegouts, *EVENT_SCHEMAS["powpeg_pegouts"], with_periods=True)
+    penalties = _project(flyover_penalties, *EVENT_SCHEMAS["penalties"])
+    top_lp = top_liquidity_provider(fp_pegins, penalties)
+    del fp_pegins["lp_address"]
+
+    # Peg-out refunds (LP claimed BTC delivery) mark which peg-outs completed
+    pegout_refund_hashes = {e.get("quote_hash", "") for e in flyover_pegout_refunds}
+    pegouts_completed = sum(h in pegout_refund_hashes for h in fp_pegouts.pop("quote_hash"))
+
+    streams = {
         "flyover_pegins": fp_pegins,
         "flyover_pegouts": fp_pegouts,
-        "pegout_refund_hashes": list(pegout_refund_hashes),
         "powpeg_pegins": pp_pegins,
         "powpeg_pegouts": pp_pegouts,
-        "penalties": penalties,
-        "refunds": refunds,
-        "lp_info": lp_info or {},
-        "btc_locked": btc_locked_stats or {},
-        "web_analytics": web_analytics or {},
-        "route_health": route_health or {},
-        "generated_at": datetime.now(timezone.utc).isoformat(),
     }
+    aggregates = aggregate_periods(streams)
+    wallets = wallet_stats([fp_pegins, fp_pegouts], [pp_pegins, pp_pegouts])
+    for columns in streams.values():
+        del columns["pkeys"], columns["address"]
 
+    return {
+        **streams,
+        "pegouts_completed": pegouts_completed,
+        "aggregates": aggregates,
+        "wallets": wallets,
+        "top_lp": top_lp,
+        "lp_info": {k: lp_info[k] for k in LP_INFO_FIELDS if k in lp_info} if lp_info else {},
+        "btc_locked": (
+            {k: btc_locked_stats[k] for k in BTC_LOCKED_FIELDS if k in btc_locked_stats} if btc_locked_stats else {}
+        ),
+        "route_health": route_health or {},
+        # Serialized as RFC 3339 by write_json
+        "generated_at": datetime.now(timezone.utc),
+    }
 
-def generate_html() -> str:
-    """Generate the full HTML dashboard (loads data via fetch at runtime)."""
 
-    return """<!DOCTYPE html>
+# Static page shell. The dashboard data is not interpolated here; the page
+# fetches data/dashboard.json at runtime, so the template is built once at
+# import and returned as-is.
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -159,7 +428,7 @@ def generate_html() -> str:
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
 <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-<script src="https://cdn.plot.ly/plotly-2.35.0.min.js"></script>
+<script async id="plotly-js" src="https://cdn.plot.ly/plotly-basic-2.35.0.min.js"></script>
 <style>
   :root {
     --bg: #0a0a0a;
@@ -1093,6 +1362,68 @@ def generate_html() -> str:
     <div id="health-panel" class="health-panel"></div>
   </section>
 
+  <!-- Health panel skeleton; renderHealth clones it and fills the data-f slots -->
+  <template id="health-panel-tpl">
+    <div class="health-header">
+      <h3><span class="health-overall-dot" data-f="dot"></span><span class="health-overall-label" data-f="overall"></span><span class="lp-name" style="margin-left:12px" data-f="lp-name"></span><span class="live-badge" data-f="live">LIVE</span></h3>
+      <span data-f="age"></span>
+    </div>
+    <div class="health-grid">
+      <div class="health-indicator" data-f="pegin">
+        <button class="health-info-btn">i</button>
+        <div class="health-popover">
+          <div class="health-popover-row"><span class="health-popover-dot" style="background:#EAB308"></span> Warning: &lt; 10 RBTC</div>
+          <div class="health-popover-row"><span class="health-popover-dot" style="background:var(--red)"></span> Critical: &lt; 5 RBTC</div>
+        </div>
+        <div class="health-indicator-label">Peg-In Balance</div>
+        <div class="health-indicator-value" data-f="value"></div>
+        <div class="health-indicator-sub" data-f="sub"></div>
+        <div class="health-indicator-status" data-f="status"></div>
+      </div>
+      <div class="health-indicator" data-f="pegout">
+        <button class="health-info-btn">i</button>
+        <div class="health-popover">
+          <div class="health-popover-row"><span class="health-popover-dot" style="background:#EAB308"></span> Warning: &lt; 10 BTC</div>
+          <div class="health-popover-row"><span class="health-popover-dot" style="background:var(--red)"></span> Critical: &lt; 5 BTC</div>
+        </div>
+        <div class="health-indicator-label">Peg-Out Balance</div>
+        <div class="health-indicator-value" data-f="value"></div>
+        <div class="health-indicator-sub" data-f="sub"></div>
+        <div class="health-indicator-status" data-f="status"></div>
+      </div>
+      <div class="health-indicator" data-f="utxo">
+        <button class="health-info-btn">i</button>
+        <div class="health-popover">
+          <div class="health-popover-row"><span class="health-popover-dot" style="background:#EAB308"></span> Warning: &lt; 4 UTXOs</div>
+          <div class="health-popover-row"><span class="health-popover-dot" style="background:var(--red)"></span> Critical: &lt; 2 UTXOs</div>
+        </div>
+        <div class="health-indicator-label">BTC UTXOs</div>
+        <div class="health-indicator-value" data-f="value"></div>
+        <div class="health-indicator-sub" data-f="sub"></div>
+        <div class="health-indicator-sub" style="color:#EAB308" data-f="mempool"></div>
+        <div class="health-indicator-status" data-f="status"></div>
+      </div>
+      <div class="health-indicator" data-f="last-pegin">
+        <div class="health-indicator-label">Last Peg-In</div>
+        <div class="health-indicator-value" data-f="value"></div>
+        <div class="health-indicator-sub" data-f="sub"></div>
+        <div class="health-indicator-sub" data-f="date"></div>
+      </div>
+      <div class="health-indicator" data-f="last-pegout">
+        <div class="health-indicator-label">Last Peg-Out</div>
+        <div class="health-indicator-value" data-f="value"></div>
+        <div class="health-indicator-sub" data-f="sub"></div>
+        <div class="health-indicator-sub" data-f="date"></div>
+      </div>
+      <div class="health-indicator" data-f="ops">
+        <div class="health-indicator-label">Operations</div>
+        <div class="health-indicator-value" data-f="value"></div>
+        <div class="health-indicator-sub" data-f="sub"></div>
+        <div class="health-indicator-sub" data-f="penalties"></div>
+      </div>
+    </div>
+  </template>
+
   <section class="health-section" id="route-health-section" style="display:none">
     <div class="section-title">Route Health</div>
     <div id="route-health-panel" class="route-health-panel"></div>
@@ -1159,6 +1490,31 @@ def generate_html() -> str:
     </div>
   </section>
 
+  <!-- Breakdown table skeleton and row; renderTable clones these -->
+  <template id="table-tpl">
+    <table>
+      <thead>
+        <tr>
+          <th rowspan="2">Period</th>
+          <th colspan="2" class="th-group" style="color:#DEFF19">Flyover Peg-In</th>
+          <th colspan="2" class="th-group" style="color:#F0FF96">Flyover Peg-Out</th>
+          <th colspan="2" class="th-group" style="color:#FF9100">PowPeg Peg-In</th>
+          <th colspan="2" class="th-group" style="color:#FED8A7">PowPeg Peg-Out</th>
+        </tr>
+        <tr>
+          <th>Txs</th><th>Vol</th>
+          <th>Txs</th><th>Vol</th>
+          <th>Txs</th><th>Vol</th>
+          <th>Txs</th><th>Vol</th>
+        </tr>
+      </thead>
+      <tbody></tbody>
+    </table>
+  </template>
+  <template id="table-row-tpl">
+    <tr><td><strong></strong></td><td></td><td></td><td></td><td></td><td></td><td></td><td></td><td></td></tr>
+  </template>
+
   <footer>
     Atlas Dashboard
   </footer>
@@ -1180,43 +1536,30 @@ function parseTS(ts) {
   return isNaN(d.getTime()) ? null : d;
 }
 
-function periodKey(date, period) {
-  if (!date) return 'unknown';
-  const y = date.getFullYear();
-  const m = String(date.getMonth() + 1).padStart(2, '0');
-  const d = String(date.getDate()).padStart(2, '0');
-  switch (period) {
-    case 'quarter': return `${y}-Q${Math.ceil((date.getMonth()+1)/3)}`;
-    case 'month': return `${y}-${m}`;
-    case 'week':
-      const thu = new Date(date);
-      thu.setDate(thu.getDate() + 3 - ((thu.getDay() + 6) % 7));
-      const jan4 = new Date(thu.getFullYear(), 0, 4);
-      const week = 1 + Math.round(((thu - jan4) / 86400000 - 3 + ((jan4.getDay() + 6) % 7)) / 7);
-      return `${thu.getFullYear()}-W${String(week).padStart(2,'0')}`;
-    case 'day': return `${y}-${m}-${d}`;
-    default: return `${y}-${m}`;
-  }
-}
+// Event amounts (value_sat etc.) are integer satoshis; aggregates are RBTC
+const SATS_PER_RBTC = 1e8;
 
-function groupBy(events, period) {
-  const groups = {};
-  for (const e of events) {
-    const d = parseTS(e.timestamp);
-    const key = periodKey(d, period);
-    if (!groups[key]) groups[key] = [];
-    groups[key].push(e);
-  }
-  return groups;
+// Event streams (DATA.flyover_pegins etc.) are column arrays: field -> list,
+// index-aligned across fields, with rows in block (i.e. time) order.
+// Timestamps are Unix seconds (null when the source value was unparseable),
+// so hot loops compare numbers and only build a Date for display.
+function rowCount(stream) {
+  return stream.tx_hash.length;
 }
 
-function sumField(events, field) {
-  return events.reduce((s, e) => s + (e[field] || 0), 0);
+// Index of the most recent event in a stream, or -1 if there is none.
+// Among events sharing the latest timestamp, the first one wins.
+function latestIndex(stream) {
+  const ts = stream.timestamp;
+  let i = ts.length - 1;
+  while (i >= 0 && !ts[i]) i--;
+  while (i > 0 && ts[i - 1] === ts[i]) i--;
+  return i;
 }
 
-function fmt(n, decimals = 4) {
-  if (n >= 1000) return n.toLocaleString(undefined, { maximumFractionDigits: decimals });
-  return n.toFixed(decimals);
+// Bucket i of a precomputed series, or 0 when the bucket doesn't exist
+function at(arr, i) {
+  return i >= 0 ? arr[i] : 0;
 }
 
 function fmtCompact(n) {
@@ -1241,57 +1584,28 @@ function periodLabel() {
   return { day: 'day', week: 'week', month: 'month', quarter: 'quarter' }[currentPeriod] || 'period';
 }
 
-const MONTH_NAMES = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];
-function fmtPeriodKey(key) {
-  // "2025-04" → "Apr 2025", "2025-Q2" → "Q2 2025", "2025-W08" → "W08 2025", "2025-04-10" → "Apr 10, 2025"
-  const mMatch = key.match(/^(\\d{4})-(\\d{2})$/);
-  if (mMatch) return MONTH_NAMES[parseInt(mMatch[2], 10) - 1] + ' ' + mMatch[1];
-  const qMatch = key.match(/^(\\d{4})-(Q\\d)$/);
-  if (qMatch) return qMatch[2] + ' ' + qMatch[1];
-  const wMatch = key.match(/^(\\d{4})-(W\\d{2})$/);
-  if (wMatch) return wMatch[2] + ' ' + wMatch[1];
-  const dMatch = key.match(/^(\\d{4})-(\\d{2})-(\\d{2})$/);
-  if (dMatch) return MONTH_NAMES[parseInt(dMatch[2], 10) - 1] + ' ' + parseInt(dMatch[3], 10) + ', ' + dMatch[1];
-  return key;
-}
-
-function getLatestTwo(events, period) {
-  const groups = groupBy(events, period);
-  const keys = Object.keys(groups).filter(k => k !== 'unknown').sort();
-  if (keys.length === 0) return { current: [], previous: [], currentKey: '', prevKey: '' };
-  const currentKey = keys[keys.length - 1];
-  const prevKey = keys.length > 1 ? keys[keys.length - 2] : '';
-  return {
-    current: groups[currentKey] || [],
-    previous: prevKey ? (groups[prevKey] || []) : [],
-    currentKey,
-    prevKey,
-  };
-}
-
-// Compute a global reference period from all 4 datasets so all summary cards,
-// donuts, and deltas use the same time bucket (prevents mixing months when one
-// operation type has no data in the latest period).
-function getGlobalRefKeys(period) {
-  const allEvents = [
-    ...DATA.flyover_pegins, ...DATA.flyover_pegouts,
-    ...DATA.powpeg_pegins, ...DATA.powpeg_pegouts,
-  ];
-  const groups = groupBy(allEvents, period);
-  const keys = Object.keys(groups).filter(k => k !== 'unknown').sort();
-  const currentKey = keys.length > 0 ? keys[keys.length - 1] : '';
-  const prevKey = keys.length > 1 ? keys[keys.length - 2] : '';
-  return { currentKey, prevKey };
+// Rendered output (HTML string or detached node) by section/period key. DATA
+// is fixed after load, so entries never go stale; the cap (least recently
+// used goes first) only bounds memory.
+const FRAGMENT_CACHE_SIZE = 12;
+const fragmentCache = new Map();
+function cached(key, build) {
+  let html = fragmentCache.get(key);
+  if (html === undefined) {
+    html = build();
+    if (fragmentCache.size >= FRAGMENT_CACHE_SIZE) fragmentCache.delete(fragmentCache.keys().next().value);
+  } else {
+    fragmentCache.delete(key);
+  }
+  fragmentCache.set(key, html);
+  return html;
 }
 
-function getForPeriod(events, period, refCurrentKey, refPrevKey) {
-  const groups = groupBy(events, period);
-  return {
-    current: groups[refCurrentKey] || [],
-    previous: refPrevKey ? (groups[refPrevKey] || []) : [],
-    currentKey: refCurrentKey,
-    prevKey: refPrevKey,
-  };
+// Summary cards, donuts and deltas all use the latest two buckets across the
+// 4 datasets (DATA.aggregates keys are the union), so one operation type with
+// no data in the latest period can't shift the others to an older bucket.
+function refIndexes(agg) {
+  return { cur: agg.keys.length - 1, prev: agg.keys.length - 2 };
 }
 
 // ─── BTC Locked ───
@@ -1341,124 +1655,11 @@ function renderBtcLocked() {
 
 // ─── Unique Wallets ───
 
-const LP_ADDRESS = '0x82a06ebdb97776a2da4041df8f2b2ea8d3257852';
-
-function getUserAddress(event) {
-  return (event.address || '').toLowerCase();
-}
-
-function isUserAddress(addr) {
-  return addr && addr !== LP_ADDRESS;
-}
-
-function computeWalletStats() {
-  const periods = ['day', 'week', 'month', 'quarter'];
-  const flyoverEvents = [...DATA.flyover_pegins, ...DATA.flyover_pegouts];
-  const powpegEvents = [...DATA.powpeg_pegins, ...DATA.powpeg_pegouts];
-  const stats = {};
-
-  for (const period of periods) {
-    const flyoverGroups = {};
-    const powpegGroups = {};
-    const combinedGroups = {};
-
-    for (const e of flyoverEvents) {
-      const addr = getUserAddress(e);
-      if (!isUserAddress(addr)) continue;
-      const d = parseTS(e.timestamp);
-      const key = periodKey(d, period);
-      if (key === 'unknown') continue;
-      if (!flyoverGroups[key]) flyoverGroups[key] = new Set();
-      if (!combinedGroups[key]) combinedGroups[key] = new Set();
-      flyoverGroups[key].add(addr);
-      combinedGroups[key].add(addr);
-    }
-
-    for (const e of powpegEvents) {
-      const addr = getUserAddress(e);
-      if (!isUserAddress(addr)) continue;
-      const d = parseTS(e.timestamp);
-      const key = periodKey(d, period);
-      if (key === 'unknown') continue;
-      if (!powpegGroups[key]) powpegGroups[key] = new Set();
-      if (!combinedGroups[key]) combinedGroups[key] = new Set();
-      powpegGroups[key].add(addr);
-      combinedGroups[key].add(addr);
-    }
-
-    const fKeys = Object.keys(flyoverGroups);
-    const pKeys = Object.keys(powpegGroups);
-    const cKeys = Object.keys(combinedGroups);
-
-    const avgF = fKeys.length > 0
-      ? fKeys.reduce((s, k) => s + flyoverGroups[k].size, 0) / fKeys.length : 0;
-    const avgP = pKeys.length > 0
-      ? pKeys.reduce((s, k) => s + powpegGroups[k].size, 0) / pKeys.length : 0;
-
-    const allF = new Set();
-    const allP = new Set();
-    for (const k of fKeys) flyoverGroups[k].forEach(a => allF.add(a));
-    for (const k of pKeys) powpegGroups[k].forEach(a => allP.add(a));
-    const allC = new Set([...allF, ...allP]);
-
-    stats[period] = {
-      avgFlyover: Math.round(avgF),
-      avgPowpeg: Math.round(avgP),
-      avgCombined: cKeys.length > 0
-        ? Math.round(cKeys.reduce((s, k) => s + combinedGroups[k].size, 0) / cKeys.length) : 0,
-      totalFlyover: allF.size,
-      totalPowpeg: allP.size,
-      totalCombined: allC.size,
-    };
-  }
-  return stats;
-}
-
-function computeRepeatWallets() {
-  const flyoverAddrs = {};
-  const powpegAddrs = {};
-  const combinedAddrs = {};
-
-  for (const e of [...DATA.flyover_pegins, ...DATA.flyover_pegouts]) {
-    const addr = getUserAddress(e);
-    if (!isUserAddress(addr)) continue;
-    flyoverAddrs[addr] = (flyoverAddrs[addr] || 0) + 1;
-    combinedAddrs[addr] = (combinedAddrs[addr] || 0) + 1;
-  }
-
-  for (const e of [...DATA.powpeg_pegins, ...DATA.powpeg_pegouts]) {
-    const addr = getUserAddress(e);
-    if (!isUserAddress(addr)) continue;
-    powpegAddrs[addr] = (powpegAddrs[addr] || 0) + 1;
-    combinedAddrs[addr] = (combinedAddrs[addr] || 0) + 1;
-  }
-
-  function countRepeat(addrMap) {
-    const total = Object.keys(addrMap).length;
-    const repeat = Object.values(addrMap).filter(c => c > 1).length;
-    return { total, repeat, pct: total > 0 ? (repeat / total * 100) : 0 };
-  }
-
-  // Cross-protocol: wallets that appear in both flyover and powpeg
-  const flyoverSet = new Set(Object.keys(flyoverAddrs));
-  const powpegSet = new Set(Object.keys(powpegAddrs));
-  let crossProtocol = 0;
-  for (const addr of flyoverSet) {
-    if (powpegSet.has(addr)) crossProtocol++;
-  }
-
-  return {
-    flyover: countRepeat(flyoverAddrs),
-    powpeg: countRepeat(powpegAddrs),
-    combined: countRepeat(combinedAddrs),
-    crossProtocol,
-  };
-}
-
+// Wallet counts are precomputed by the generator (DATA.wallets)
 function renderWallets() {
   const el = document.getElementById('wallets-content');
-  const stats = computeWalletStats();
-  const repeat = computeRepeatWallets();
+  const w = DATA.wallets;
+  const repeatPct = name => w.unique[name] > 0 ? (w.repeat[name] / w.unique[name] * 100) : 0;
 
   const rows = [
     { label: 'Daily Avg', key: 'day' },
@@ -1478,22 +1679,23 @@ function renderWallets() {
     </thead><tbody>`;
 
   for (const row of rows) {
-    const s = stats[row.key];
+    const s = w.avg[row.key];
     html += '<tr>' +
       '<td>' + row.label + '</td>' +
-      '<td class="wallet-num col-flyover">~' + s.avgFlyover + '</td>' +
-      '<td class="wallet-num col-powpeg">~' + s.avgPowpeg + '</td>' +
-      '<td class="wallet-num col-combined">~' + s.avgCombined + '</td>' +
+      '<td class="wallet-num col-flyover">~' + s.flyover + '</td>' +
+      '<td class="wallet-num col-powpeg">~' + s.powpeg + '</td>' +
+      '<td class="wallet-num col-combined">~' + s.combined + '</td>' +
     '</tr>';
   }
 
   // Find earliest event date for the "since" label
-  let earliest = null;
-  const allEvts = [...DATA.flyover_pegins, ...DATA.flyover_pegouts, ...DATA.powpeg_pegins, ...DATA.powpeg_pegouts];
-  for (const e of allEvts) {
-    const d = parseTS(e.timestamp);
-    if (d && (!earliest || d < earliest)) earliest = d;
+  let first = Infinity;
+  for (const s of [DATA.flyover_pegins, DATA.flyover_pegouts, DATA.powpeg_pegins, DATA.powpeg_pegouts]) {
+    for (const ts of s.timestamp) {
+      if (ts && ts < first) first = ts;
+    }
   }
+  const earliest = first < Infinity ? parseTS(first) : null;
   const sinceLabel = earliest
     ? 'Since ' + earliest.toLocaleDateString('en-US', { month: 'short', year: 'numeric' })
     : 'Cumulative';
@@ -1504,24 +1706,24 @@ function renderWallets() {
   // Unique wallets row
   html += '<tr>' +
     '<td>Unique Wallets</td>' +
-    '<td class="wallet-num col-flyover">' + repeat.flyover.total + '</td>' +
-    '<td class="wallet-num col-powpeg">' + repeat.powpeg.total + '</td>' +
-    '<td class="wallet-num col-combined">' + repeat.combined.total + '</td>' +
+    '<td class="wallet-num col-flyover">' + w.unique.flyover + '</td>' +
+    '<td class="wallet-num col-powpeg">' + w.unique.powpeg + '</td>' +
+    '<td class="wallet-num col-combined">' + w.unique.combined + '</td>' +
   '</tr>';
 
   // Repeat wallets row
   html += '<tr style="background:rgba(158,117,255,0.04)">' +
     '<td>Repeat Wallets<div style="color:var(--muted);font-size:10px;font-weight:400;margin-top:2px">bridged 2+ times</div></td>' +
-    '<td class="wallet-num col-flyover">' + repeat.flyover.repeat + ' <span style="font-size:12px;font-weight:600">(' + repeat.flyover.pct.toFixed(0) + '%)</span></td>' +
-    '<td class="wallet-num col-powpeg">' + repeat.powpeg.repeat + ' <span style="font-size:12px;font-weight:600">(' + repeat.powpeg.pct.toFixed(0) + '%)</span></td>' +
-    '<td class="wallet-num col-combined">' + repeat.combined.repeat + ' <span style="font-size:12px;font-weight:600">(' + repeat.combined.pct.toFixed(0) + '%)</span></td>' +
+    '<td class="wallet-num col-flyover">' + w.repeat.flyover + ' <span style="font-size:12px;font-weight:600">(' + repeatPct('flyover').toFixed(0) + '%)</span></td>' +
+    '<td class="wallet-num col-powpeg">' + w.repeat.powpeg + ' <span style="font-size:12px;font-weight:600">(' + repeatPct('powpeg').toFixed(0) + '%)</span></td>' +
+    '<td class="wallet-num col-combined">' + w.repeat.combined + ' <span style="font-size:12px;font-weight:600">(' + repeatPct('combined').toFixed(0) + '%)</span></td>' +
   '</tr>';
 
   html += '</tbody></table>';
 
-  if (repeat.crossProtocol > 0) {
+  if (w.cross_protocol > 0) {
     html += '<div style="color:var(--muted);font-size:11px;margin-top:10px;text-align:right">' +
-      repeat.crossProtocol + ' wallet' + (repeat.crossProtocol !== 1 ? 's' : '') + ' used both Flyover and PowPeg' +
+      w.cross_protocol + ' wallet' + (w.cross_protocol !== 1 ? 's' : '') + ' used both Flyover and PowPeg' +
     '</div>';
   }
 
@@ -1540,24 +1742,28 @@ function deltaText(current, previous) {
 }
 
 function renderSummary() {
+  document.getElementById('op-summary').innerHTML = cached('summary:' + currentPeriod, buildSummaryHTML);
+}
+
+function buildSummaryHTML() {
   const ops = [
-    { name: 'Flyover Peg-In', data: DATA.flyover_pegins, color: '#DEFF19', field: 'value_rbtc' },
-    { name: 'Flyover Peg-Out', data: DATA.flyover_pegouts, color: '#F0FF96', field: 'value_rbtc' },
-    { name: 'PowPeg Peg-In', data: DATA.powpeg_pegins, color: '#FF9100', field: 'value_rbtc' },
-    { name: 'PowPeg Peg-Out', data: DATA.powpeg_pegouts, color: '#FED8A7', field: 'value_rbtc' },
+    { name: 'Flyover Peg-In', key: 'flyover_pegins', color: '#DEFF19' },
+    { name: 'Flyover Peg-Out', key: 'flyover_pegouts', color: '#F0FF96' },
+    { name: 'PowPeg Peg-In', key: 'powpeg_pegins', color: '#FF9100' },
+    { name: 'PowPeg Peg-Out', key: 'powpeg_pegouts', color: '#FED8A7' },
   ];
 
-  const period = currentPeriod;
-  const ref = getGlobalRefKeys(period);
+  const agg = DATA.aggregates[currentPeriod];
+  const ref = refIndexes(agg);
   let totalTxs = 0, totalVol = 0;
 
   let cards = '';
   for (const op of ops) {
-    const latest = getForPeriod(op.data, period, ref.currentKey, ref.prevKey);
-    const curTxs = latest.current.length;
-    const prevTxs = latest.previous.length;
-    const curVol = sumField(latest.current, op.field);
-    const prevVol = sumField(latest.previous, op.field);
+    const series = agg[op.key];
+    const curTxs = at(series.count, ref.cur);
+    const prevTxs = at(series.count, ref.prev);
+    const curVol = at(series.volume, ref.cur);
+    const prevVol = at(series.volume, ref.prev);
     totalTxs += curTxs;
     totalVol += curVol;
 
@@ -1579,11 +1785,24 @@ function renderSummary() {
       </div>`;
   }
 
-  const el = document.getElementById('op-summary');
-  el.innerHTML = cards;
+  return cards;
 }
 
+// Plotly loads async so it doesn't hold up first paint; charts render once
+// it arrives, for whatever period is current by then
+let chartsWaiting = false;
+
 function renderCharts() {
+  if (typeof Plotly === 'undefined') {
+    if (!chartsWaiting) {
+      chartsWaiting = true;
+      document.getElementById('plotly-js').addEventListener('load', () => {
+        chartsWaiting = false;
+        renderCharts();
+      }, { once: true });
+    }
+    return;
+  }
   const period = currentPeriod;
   const cfg = { displayModeBar: false, responsive: true };
   const hoverLabel = {
@@ -1602,24 +1821,19 @@ function renderCharts() {
     height: 280,
   };
 
-  const fpG = groupBy(DATA.flyover_pegins, period);
-  const foG = groupBy(DATA.flyover_pegouts, period);
-  const ppG = groupBy(DATA.powpeg_pegins, period);
-  const poG = groupBy(DATA.powpeg_pegouts, period);
-
-  const keys = [...new Set([
-    ...Object.keys(fpG), ...Object.keys(foG),
-    ...Object.keys(ppG), ...Object.keys(poG),
-  ])].filter(k => k !== 'unknown').sort();
+  const agg = DATA.aggregates[period];
+  const keys = agg.keys;
+  const fp = agg.flyover_pegins, fo = agg.flyover_pegouts;
+  const pp = agg.powpeg_pegins, po = agg.powpeg_pegouts;
 
   // Volume chart — toggle between area and bar
   const mkHover = (label, rbtcArr) => rbtcArr.map(v =>
     `${label}: ${fmtRBTC(v)}`);
 
-  const fpV = keys.map(k => sumField(fpG[k] || [], 'value_rbtc'));
-  const foV = keys.map(k => sumField(foG[k] || [], 'value_rbtc'));
-  const ppV = keys.map(k => sumField(ppG[k] || [], 'value_rbtc'));
-  const poV = keys.map(k => sumField(poG[k] || [], 'value_rbtc'));
+  const fpV = fp.volume;
+  const foV = fo.volume;
+  const ppV = pp.volume;
+  const poV = po.volume;
 
   const volTraces = chartMode === 'area' ? [
     { x: keys, y: fpV, name: 'Flyover In', type: 'scatter', stackgroup: 'vol',
@@ -1654,19 +1868,16 @@ function renderCharts() {
     ...(chartMode === 'bar' ? { barmode: 'stack' } : {}),
     hovermode: 'x unified',
   };
-  Plotly.newPlot('chart-volume-trend', volTraces, volLayout, cfg);
+  // react() updates an existing plot in place on period/mode switches
+  // (newPlot would tear down and rebuild the SVG); first call creates it
+  Plotly.react('chart-volume-trend', volTraces, volLayout, cfg);
 
   // Volume donut — filtered by period (uses global reference period)
-  const ref = getGlobalRefKeys(period);
-  const latestFp = getForPeriod(DATA.flyover_pegins, period, ref.currentKey, ref.prevKey);
-  const latestFo = getForPeriod(DATA.flyover_pegouts, period, ref.currentKey, ref.prevKey);
-  const latestPp = getForPeriod(DATA.powpeg_pegins, period, ref.currentKey, ref.prevKey);
-  const latestPo = getForPeriod(DATA.powpeg_pegouts, period, ref.currentKey, ref.prevKey);
-
-  const fpVol = sumField(latestFp.current, 'value_rbtc');
-  const foVol = sumField(latestFo.current, 'value_rbtc');
-  const ppVol = sumField(latestPp.current, 'value_rbtc');
-  const poVol = sumField(latestPo.current, 'value_rbtc');
+  const cur = refIndexes(agg).cur;
+  const fpVol = at(fpV, cur);
+  const foVol = at(foV, cur);
+  const ppVol = at(ppV, cur);
+  const poVol = at(poV, cur);
   const total = fpVol + foVol + ppVol + poVol;
 
   const donutLayout = {
@@ -1677,7 +1888,7 @@ function renderCharts() {
     uniformtext: { minsize: 10, mode: 'hide' },
   };
 
-  Plotly.newPlot('chart-donut', [{
+  Plotly.react('chart-donut', [{
     values: [fpVol, foVol, ppVol, poVol],
     labels: ['Flyover In', 'Flyover Out', 'PowPeg In', 'PowPeg Out'],
     type: 'pie',
@@ -1702,13 +1913,13 @@ function renderCharts() {
   }, cfg);
 
   // Transaction count donut — filtered by period
-  const fpTx = latestFp.current.length;
-  const foTx = latestFo.current.length;
-  const ppTx = latestPp.current.length;
-  const poTx = latestPo.current.length;
+  const fpTx = at(fp.count, cur);
+  const foTx = at(fo.count, cur);
+  const ppTx = at(pp.count, cur);
+  const poTx = at(po.count, cur);
   const totalTx = fpTx + foTx + ppTx + poTx;
 
-  Plotly.newPlot('chart-tx-donut', [{
+  Plotly.react('chart-tx-donut', [{
     values: [fpTx, foTx, ppTx, poTx],
     labels: ['Flyover In', 'Flyover Out', 'PowPeg In', 'PowPeg Out'],
     type: 'pie',
@@ -1733,12 +1944,10 @@ function renderCharts() {
   }, cfg);
 
   // --- Net Flow chart (Peg-In minus Peg-Out) ---
-  const flyoverNet = keys.map(k =>
-    sumField(fpG[k] || [], 'value_rbtc') - sumField(foG[k] || [], 'value_rbtc'));
-  const powpegNet = keys.map(k =>
-    sumField(ppG[k] || [], 'value_rbtc') - sumField(poG[k] || [], 'value_rbtc'));
+  const flyoverNet = keys.map((k, i) => fpV[i] - foV[i]);
+  const powpegNet = keys.map((k, i) => ppV[i] - poV[i]);
 
-  Plotly.newPlot('chart-net-flow', [
+  Plotly.react('chart-net-flow', [
     { x: keys, y: flyoverNet, name: 'Flyover', type: 'bar',
       marker: { color: flyoverNet.map(v => v >= 0 ? '#DEFF19' : 'rgba(222,255,25,0.35)') },
       hovertext: flyoverNet.map(v => 'Flyover: ' + (v >= 0 ? '+' : '') + fmtRBTC(v) + ' RBTC'),
@@ -1755,12 +1964,13 @@ function renderCharts() {
   }, cfg);
 
   // --- Avg Transaction Size chart ---
-  const fpAvg = keys.map(k => { const e = fpG[k] || []; return e.length > 0 ? sumField(e, 'value_rbtc') / e.length : 0; });
-  const foAvg = keys.map(k => { const e = foG[k] || []; return e.length > 0 ? sumField(e, 'value_rbtc') / e.length : 0; });
-  const ppAvg = keys.map(k => { const e = ppG[k] || []; return e.length > 0 ? sumField(e, 'value_rbtc') / e.length : 0; });
-  const poAvg = keys.map(k => { const e = poG[k] || []; return e.length > 0 ? sumField(e, 'value_rbtc') / e.length : 0; });
+  const avgOf = s => s.count.map((n, i) => n > 0 ? s.volume[i] / n : 0);
+  const fpAvg = avgOf(fp);
+  const foAvg = avgOf(fo);
+  const ppAvg = avgOf(pp);
+  const poAvg = avgOf(po);
 
-  Plotly.newPlot('chart-avg-tx', [
+  Plotly.react('chart-avg-tx', [
     { x: keys, y: fpAvg, name: 'Flyover In', type: 'scatter', mode: 'lines+markers',
       line: { color: '#DEFF19', width: 2 }, marker: { size: 4, color: '#DEFF19' },
       hovertext: fpAvg.map(v => 'Flyover In avg: ' + fmtRBTC(v)), hoverinfo: 'text' },
@@ -1780,87 +1990,78 @@ function renderCharts() {
 
 let tablePage = 0;
 const PAGE_SIZE = 15;
+const TABLE_TPL = document.getElementById('table-tpl');
+const TABLE_ROW_TPL = document.getElementById('table-row-tpl');
 
 function renderTable() {
-  const fpG = groupBy(DATA.flyover_pegins, currentPeriod);
-  const foG = groupBy(DATA.flyover_pegouts, currentPeriod);
-  const ppG = groupBy(DATA.powpeg_pegins, currentPeriod);
-  const poG = groupBy(DATA.powpeg_pegouts, currentPeriod);
+  const agg = DATA.aggregates[currentPeriod];
+  const keys = agg.keys;
 
-  const allKeys = [...new Set([
-    ...Object.keys(fpG), ...Object.keys(foG),
-    ...Object.keys(ppG), ...Object.keys(poG),
-  ])].filter(k => k !== 'unknown').sort().reverse();
-
-  const totalPages = Math.max(1, Math.ceil(allKeys.length / PAGE_SIZE));
+  // Newest period first
+  const totalPages = Math.max(1, Math.ceil(keys.length / PAGE_SIZE));
   tablePage = Math.max(0, Math.min(tablePage, totalPages - 1));
-  const pageKeys = allKeys.slice(tablePage * PAGE_SIZE, (tablePage + 1) * PAGE_SIZE);
-
-  // Compute totals across ALL keys (not just current page)
-  let totFpTx = 0, totFpVol = 0, totFoTx = 0, totFoVol = 0;
-  let totPpTx = 0, totPpVol = 0, totPoTx = 0, totPoVol = 0;
-  for (const key of allKeys) {
-    const fp = fpG[key] || [], fo = foG[key] || [];
-    const pp = ppG[key] || [], po = poG[key] || [];
-    totFpTx += fp.length; totFpVol += sumField(fp, 'value_rbtc');
-    totFoTx += fo.length; totFoVol += sumField(fo, 'value_rbtc');
-    totPpTx += pp.length; totPpVol += sumField(pp, 'value_rbtc');
-    totPoTx += po.length; totPoVol += sumField(po, 'value_rbtc');
-  }
-
-  let html = `<table>
-    <thead>
-      <tr>
-        <th rowspan="2">Period</th>
-        <th colspan="2" class="th-group" style="color:#DEFF19">Flyover Peg-In</th>
-        <th colspan="2" class="th-group" style="color:#F0FF96">Flyover Peg-Out</th>
-        <th colspan="2" class="th-group" style="color:#FF9100">PowPeg Peg-In</th>
-        <th colspan="2" class="th-group" style="color:#FED8A7">PowPeg Peg-Out</th>
-      </tr>
-      <tr>
-        <th>Txs</th><th>Vol</th>
-        <th>Txs</th><th>Vol</th>
-        <th>Txs</th><th>Vol</th>
-        <th>Txs</th><th>Vol</th>
-      </tr>
-    </thead><tbody>`;
-
-  for (const key of pageKeys) {
-    const fp = fpG[key] || [], fo = foG[key] || [];
-    const pp = ppG[key] || [], po = poG[key] || [];
-
-    html += `<tr>
-      <td><strong>${fmtPeriodKey(key)}</strong></td>
-      <td>${fp.length}</td><td>${fmtRBTC(sumField(fp, 'value_rbtc'))}</td>
-      <td>${fo.length}</td><td>${fmtRBTC(sumField(fo, 'value_rbtc'))}</td>
-      <td>${pp.length}</td><td>${fmtRBTC(sumField(pp, 'value_rbtc'))}</td>
-      <td>${po.length}</td><td>${fmtRBTC(sumField(po, 'value_rbtc'))}</td>
-    </tr>`;
-  }
-
-  // Totals row
-  html += `<tr class="totals-row">
-    <td>Total</td>
-    <td>${totFpTx}</td><td>${fmtRBTC(totFpVol)}</td>
-    <td>${totFoTx}</td><td>${fmtRBTC(totFoVol)}</td>
-    <td>${totPpTx}</td><td>${fmtRBTC(totPpVol)}</td>
-    <td>${totPoTx}</td><td>${fmtRBTC(totPoVol)}</td>
-  </tr>`;
-
-  html += '</tbody></table>';
-  document.getElementById('data-table').innerHTML = html;
+  document.getElementById('data-table').replaceChildren(
+    cached('table:' + currentPeriod + ':' + tablePage, () => buildTable(agg)));
 
   const pag = document.getElementById('table-pagination');
   if (totalPages <= 1) { pag.innerHTML = ''; return; }
   pag.innerHTML = `
-    <button class="page-btn" onclick="tableNav(-1)" ${tablePage === 0 ? 'disabled' : ''}>&larr; Prev</button>
+    <button class="page-btn" data-dir="-1" ${tablePage === 0 ? 'disabled' : ''}>&larr; Prev</button>
     <span class="page-info">${tablePage + 1} / ${totalPages}</span>
-    <button class="page-btn" onclick="tableNav(1)" ${tablePage >= totalPages - 1 ? 'disabled' : ''}>Next &rarr;</button>
+    <button class="page-btn" data-dir="1" ${tablePage >= totalPages - 1 ? 'disabled' : ''}>Next &rarr;</button>
   `;
 }
 
+function buildTable(agg) {
+  const keys = agg.keys;
+  const fp = agg.flyover_pegins, fo = agg.flyover_pegouts;
+  const pp = agg.powpeg_pegins, po = agg.powpeg_pegouts;
+  const first = keys.length - 1 - tablePage * PAGE_SIZE;
+  const last = Math.max(-1, first - PAGE_SIZE);
+
+  // Rows are built off-document and attached in one go
+  const rows = document.createDocumentFragment();
+  for (let i = first; i > last; i--) {
+    rows.appendChild(tableRow(agg.labels[i], [
+      fp.count[i], fmtRBTC(fp.volume[i]),
+      fo.count[i], fmtRBTC(fo.volume[i]),
+      pp.count[i], fmtRBTC(pp.volume[i]),
+      po.count[i], fmtRBTC(po.volume[i]),
+    ]));
+  }
+
+  // Totals row, across all keys (not just the current page)
+  const totals = tableRow('', [
+    fp.total_count, fmtRBTC(fp.total_volume),
+    fo.total_count, fmtRBTC(fo.total_volume),
+    pp.total_count, fmtRBTC(pp.total_volume),
+    po.total_count, fmtRBTC(po.total_volume),
+  ]);
+  totals.className = 'totals-row';
+  totals.firstElementChild.textContent = 'Total';
+  rows.appendChild(totals);
+
+  const table = TABLE_TPL.content.firstElementChild.cloneNode(true);
+  table.querySelector('tbody').appendChild(rows);
+  return table;
+}
+
+function tableRow(label, values) {
+  const tr = TABLE_ROW_TPL.content.firstElementChild.cloneNode(true);
+  const cells = tr.children;
+  cells[0].firstElementChild.textContent = label;
+  for (let j = 0; j < values.length; j++) cells[j + 1].textContent = values[j];
+  return tr;
+}
+
 function tableNav(dir) { tablePage += dir; renderTable(); }
 
+// One listener for the Prev/Next buttons, which are re-rendered on every page
+document.getElementById('table-pagination').addEventListener('click', e => {
+  const btn = e.target.closest('[data-dir]');
+  if (btn && !btn.disabled) tableNav(parseInt(btn.dataset.dir));
+});
+
 
 // ─── Flyover Liquidity Provider (merged Health + LP) ───
 
@@ -1870,6 +2071,12 @@ const HEALTH_THRESHOLDS = {
   btcUtxos:      { warning: 4, critical: 2 },
 };
 const STALENESS_HOURS = 25;
+const HEALTH_TPL = document.getElementById('health-panel-tpl');
+
+// Element marked data-f="name" inside a cloned template
+function slot(root, name) {
+  return root.querySelector('[data-f="' + name + '"]');
+}
 
 function assessStatus(value, thresholds) {
   if (value <= thresholds.critical) return 'critical';
@@ -1883,34 +2090,19 @@ function renderHealth() {
   const lp = DATA.lp_info || {};
   const refTime = new Date(DATA.generated_at);
 
-  if (!lp.lp_name && DATA.flyover_pegins.length === 0) {
+  if (!lp.lp_name && rowCount(DATA.flyover_pegins) === 0) {
     wrapper.style.display = 'none';
     return;
   }
   wrapper.style.display = '';
 
-  // --- LP performance stats ---
-  const lpData = {};
-  for (const e of DATA.flyover_pegins) {
-    const addr = (e.lp_address || '').toLowerCase();
-    if (!addr) continue;
-    if (!lpData[addr]) lpData[addr] = { pegins: 0, peginVol: 0, penalties: 0 };
-    lpData[addr].pegins++;
-    lpData[addr].peginVol += e.value_rbtc || 0;
-  }
-  for (const e of DATA.penalties) {
-    const addr = (e.lp_address || '').toLowerCase();
-    if (!addr) continue;
-    if (!lpData[addr]) lpData[addr] = { pegins: 0, peginVol: 0, penalties: 0 };
-    lpData[addr].penalties++;
-  }
-  const topLP = Object.entries(lpData).sort((a,b) => b[1].peginVol - a[1].peginVol)[0];
-  const lpName = (lp && lp.lp_name) ? lp.lp_name : (topLP ? shortHash(topLP[0]) : 'Unknown');
-  const peginDeliveries = topLP ? topLP[1].pegins : 0;
-  const pegoutInitiations = DATA.flyover_pegouts.length;
-  const refundHashes = new Set(DATA.pegout_refund_hashes || []);
-  const pegoutCompleted = DATA.flyover_pegouts.filter(e => refundHashes.has(e.quote_hash)).length;
-  const penaltyCount = topLP ? topLP[1].penalties : 0;
+  // --- LP performance stats (precomputed in build_dashboard_data) ---
+  const topLP = DATA.top_lp && DATA.top_lp.address ? DATA.top_lp : null;
+  const lpName = (lp && lp.lp_name) ? lp.lp_name : (topLP ? shortHash(topLP.address) : 'Unknown');
+  const peginDeliveries = topLP ? topLP.pegins : 0;
+  const pegoutInitiations = rowCount(DATA.flyover_pegouts);
+  const pegoutCompleted = DATA.pegouts_completed;
+  const penaltyCount = topLP ? topLP.penalties : 0;
 
   // --- Balances (LPS API = actual available liquidity; on-chain = wallet only) ---
   const peginOnChain = lp.pegin_rbtc != null ? parseFloat(lp.pegin_rbtc) : null;
@@ -1929,29 +2121,17 @@ function renderHealth() {
   const mempoolTxCount = lp.btc_mempool_tx_count != null ? parseInt(lp.btc_mempool_tx_count) : null;
 
   // --- Last activity ---
-  let lastPeginDate = null;
-  let lastPeginValue = 0;
-  for (const e of DATA.flyover_pegins) {
-    const d = parseTS(e.timestamp);
-    if (d && (!lastPeginDate || d > lastPeginDate)) {
-      lastPeginDate = d;
-      lastPeginValue = e.value_rbtc || 0;
-    }
-  }
+  const peginIdx = latestIndex(DATA.flyover_pegins);
+  const lastPeginDate = peginIdx >= 0 ? parseTS(DATA.flyover_pegins.timestamp[peginIdx]) : null;
+  const lastPeginValue = peginIdx >= 0 ? DATA.flyover_pegins.value_sat[peginIdx] / SATS_PER_RBTC : 0;
   const now = Date.now();
   const peginHoursAgo = lastPeginDate
     ? (now - lastPeginDate.getTime()) / (1000 * 60 * 60)
     : Infinity;
 
-  let lastPegoutDate = null;
-  let lastPegoutValue = 0;
-  for (const e of DATA.flyover_pegouts) {
-    const d = parseTS(e.timestamp);
-    if (d && (!lastPegoutDate || d > lastPegoutDate)) {
-      lastPegoutDate = d;
-      lastPegoutValue = e.value_rbtc || 0;
-    }
-  }
+  const pegoutIdx = latestIndex(DATA.flyover_pegouts);
+  const lastPegoutDate = pegoutIdx >= 0 ? parseTS(DATA.flyover_pegouts.timestamp[pegoutIdx]) : null;
+  const lastPegoutValue = pegoutIdx >= 0 ? DATA.flyover_pegouts.value_sat[pegoutIdx] / SATS_PER_RBTC : 0;
   const pegoutHoursAgo = lastPegoutDate
     ? (now - lastPegoutDate.getTime()) / (1000 * 60 * 60)
     : Infinity;
@@ -2000,92 +2180,91 @@ function renderHealth() {
        : Math.round(liveAgoSec / 60) + 'm ago')
     : '';
 
-  let html = '<div class="health-header">' +
-    '<h3>' +
-      '<span class="health-overall-dot ' + (overall !== 'healthy' ? 'pulse' : '') + '" style="background:' + statusColors[overall] + '"></span>' +
-      '<span class="health-overall-label" style="color:' + statusColors[overall] + '">' + statusLabels[overall] + '</span>' +
-      '<span class="lp-name" style="margin-left:12px">' + lpName + '</span>' +
-      (lpLive ? '<span class="live-badge">LIVE</span>' : '') +
-    '</h3>' +
-    (lpLive
-      ? '<span class="health-updated">Updated ' + liveAgoLabel + '</span>'
-      : (isStale ? '<span class="health-staleness">Data is ' + Math.round(dataAgeHours) + 'h old</span>' : '')) +
-  '</div>' +
-  '<div class="health-grid">' +
-    // Row 1, Col 1: Peg-In Balance
-    '<div class="health-indicator status-' + peginStatus + '">' +
-      '<button class="health-info-btn" onclick="toggleHealthPopover(event)">i</button>' +
-      '<div class="health-popover">' +
-        '<div class="health-popover-row"><span class="health-popover-dot" style="background:#EAB308"></span> Warning: &lt; 10 RBTC</div>' +
-        '<div class="health-popover-row"><span class="health-popover-dot" style="background:var(--red)"></span> Critical: &lt; 5 RBTC</div>' +
-      '</div>' +
-      '<div class="health-indicator-label">Peg-In Balance</div>' +
-      '<div class="health-indicator-value">' + (peginBal != null ? fmtRBTC(peginBal) : 'N/A') + '</div>' +
-      '<div class="health-indicator-sub">' + (peginBal != null ? 'RBTC available' : 'No LP data') + '</div>' +
-      '<div class="health-indicator-status ' + peginStatus + '">' + statusLabels[peginStatus] + '</div>' +
-    '</div>' +
-    // Row 1, Col 2: Peg-Out Balance
-    '<div class="health-indicator status-' + pegoutStatus + '">' +
-      '<button class="health-info-btn" onclick="toggleHealthPopover(event)">i</button>' +
-      '<div class="health-popover">' +
-        '<div class="health-popover-row"><span class="health-popover-dot" style="background:#EAB308"></span> Warning: &lt; 10 BTC</div>' +
-        '<div class="health-popover-row"><span class="health-popover-dot" style="background:var(--red)"></span> Critical: &lt; 5 BTC</div>' +
-      '</div>' +
-      '<div class="health-indicator-label">Peg-Out Balance</div>' +
-      '<div class="health-indicator-value">' + (pegoutBal != null ? fmtRBTC(pegoutBal) : 'N/A') + '</div>' +
-      '<div class="health-indicator-sub">' + (pegoutBal != null ? 'BTC available' : 'No LP data') + '</div>' +
-      '<div class="health-indicator-status ' + pegoutStatus + '">' + statusLabels[pegoutStatus] + '</div>' +
-    '</div>' +
-    // Row 1, Col 3: BTC UTXOs
-    '<div class="health-indicator status-' + utxoStatus + '">' +
-      '<button class="health-info-btn" onclick="toggleHealthPopover(event)">i</button>' +
-      '<div class="health-popover">' +
-        '<div class="health-popover-row"><span class="health-popover-dot" style="background:#EAB308"></span> Warning: &lt; 4 UTXOs</div>' +
-        '<div class="health-popover-row"><span class="health-popover-dot" style="background:var(--red)"></span> Critical: &lt; 2 UTXOs</div>' +
-      '</div>' +
-      '<div class="health-indicator-label">BTC UTXOs</div>' +
-      '<div class="health-indicator-value">' + (utxoCount != null ? utxoCount : 'N/A') + '</div>' +
-      '<div class="health-indicator-sub">' + (utxoCount != null ? (utxoCount === 1 ? '1 spendable output' : utxoCount + ' spendable outputs') : 'No data') + '</div>' +
-      (mempoolTxCount > 0
-        ? '<div class="health-indicator-sub" style="color:#EAB308">' + mempoolTxCount + ' pending tx' + (mempoolTxCount > 1 ? 's' : '') + ' in mempool</div>'
-        : '') +
-      '<div class="health-indicator-status ' + utxoStatus + '">' + statusLabels[utxoStatus] + '</div>' +
-    '</div>' +
-    // Row 2, Col 1: Last Peg-In (under Peg-In Balance)
-    '<div class="health-indicator">' +
-      '<div class="health-indicator-label">Last Peg-In</div>' +
-      '<div class="health-indicator-value">' + hoursLabel(peginHoursAgo) + '</div>' +
-      '<div class="health-indicator-sub">' + (lastPeginDate ? fmtRBTC(lastPeginValue) : 'Never') + '</div>' +
-      '<div class="health-indicator-sub">' + (lastPeginDate ? lastPeginDate.toLocaleDateString('en-US', {month:'short',day:'numeric',hour:'2-digit',minute:'2-digit'}) : '') + '</div>' +
-    '</div>' +
-    // Row 2, Col 2: Last Peg-Out (under Peg-Out Balance)
-    '<div class="health-indicator">' +
-      '<div class="health-indicator-label">Last Peg-Out</div>' +
-      '<div class="health-indicator-value">' + hoursLabel(pegoutHoursAgo) + '</div>' +
-      '<div class="health-indicator-sub">' + (lastPegoutDate ? fmtRBTC(lastPegoutValue) : 'Never') + '</div>' +
-      '<div class="health-indicator-sub">' + (lastPegoutDate ? lastPegoutDate.toLocaleDateString('en-US', {month:'short',day:'numeric',hour:'2-digit',minute:'2-digit'}) : '') + '</div>' +
-    '</div>' +
-    // Row 2, Col 3: Operations (Deliveries + Penalties)
-    '<div class="health-indicator">' +
-      '<div class="health-indicator-label">Operations</div>' +
-      '<div class="health-indicator-value">' + (peginDeliveries + pegoutCompleted) + '</div>' +
-      '<div class="health-indicator-sub">' + peginDeliveries + ' peg-in · ' + pegoutCompleted + '/' + pegoutInitiations + ' peg-out</div>' +
-      '<div class="health-indicator-sub">' + penaltyCount + ' penalt' + (penaltyCount === 1 ? 'y' : 'ies') + '</div>' +
-    '</div>' +
-  '</div>';
-
-  panel.innerHTML = html;
+  const node = HEALTH_TPL.content.cloneNode(true);
+  const dot = slot(node, 'dot');
+  if (overall !== 'healthy') dot.classList.add('pulse');
+  dot.style.background = statusColors[overall];
+  const overallLabel = slot(node, 'overall');
+  overallLabel.style.color = statusColors[overall];
+  overallLabel.textContent = statusLabels[overall];
+  slot(node, 'lp-name').textContent = lpName;
+  if (!lpLive) slot(node, 'live').remove();
+  const age = slot(node, 'age');
+  if (lpLive) {
+    age.className = 'health-updated';
+    age.textContent = 'Updated ' + liveAgoLabel;
+  } else if (isStale) {
+    age.className = 'health-staleness';
+    age.textContent = 'Data is ' + Math.round(dataAgeHours) + 'h old';
+  } else {
+    age.remove();
+  }
+
+  function fillIndicator(name, status, value, sub) {
+    const el = slot(node, name);
+    el.classList.add('status-' + status);
+    slot(el, 'value').textContent = value;
+    slot(el, 'sub').textContent = sub;
+    const statusEl = slot(el, 'status');
+    statusEl.classList.add(status);
+    statusEl.textContent = statusLabels[status];
+    return el;
+  }
+  fillIndicator('pegin', peginStatus,
+    peginBal != null ? fmtRBTC(peginBal) : 'N/A',
+    peginBal != null ? 'RBTC available' : 'No LP data');
+  fillIndicator('pegout', pegoutStatus,
+    pegoutBal != null ? fmtRBTC(pegoutBal) : 'N/A',
+    pegoutBal != null ? 'BTC available' : 'No LP data');
+  const utxoEl = fillIndicator('utxo', utxoStatus,
+    utxoCount != null ? utxoCount : 'N/A',
+    utxoCount != null ? (utxoCount === 1 ? '1 spendable output' : utxoCount + ' spendable outputs') : 'No data');
+  const mempoolEl = slot(utxoEl, 'mempool');
+  if (mempoolTxCount > 0) {
+    mempoolEl.textContent = mempoolTxCount + ' pending tx' + (mempoolTxCount > 1 ? 's' : '') + ' in mempool';
+  } else {
+    mempoolEl.remove();
+  }
+
+  const dateOpts = {month:'short',day:'numeric',hour:'2-digit',minute:'2-digit'};
+  function fillLast(name, hoursAgo, date, value) {
+    const el = slot(node, name);
+    slot(el, 'value').textContent = hoursLabel(hoursAgo);
+    slot(el, 'sub').textContent = date ? fmtRBTC(value) : 'Never';
+    slot(el, 'date').textContent = date ? date.toLocaleDateString('en-US', dateOpts) : '';
+  }
+  fillLast('last-pegin', peginHoursAgo, lastPeginDate, lastPeginValue);
+  fillLast('last-pegout', pegoutHoursAgo, lastPegoutDate, lastPegoutValue);
+
+  const ops = slot(node, 'ops');
+  slot(ops, 'value').textContent = peginDeliveries + pegoutCompleted;
+  slot(ops, 'sub').textContent = peginDeliveries + ' peg-in · ' + pegoutCompleted + '/' + pegoutInitiations + ' peg-out';
+  slot(ops, 'penalties').textContent = penaltyCount + ' penalt' + (penaltyCount === 1 ? 'y' : 'ies');
+
+  panel.replaceChildren(node);
 }
 
-function toggleHealthPopover(e) {
+// At most one popover is open; track it instead of scanning the document on every click
+let openPopover = null;
+function closeHealthPopover() {
+  if (openPopover) openPopover.classList.remove('open');
+  openPopover = null;
+}
+function toggleHealthPopover(e, btn) {
   e.stopPropagation();
-  const popover = e.currentTarget.nextElementSibling;
-  const wasOpen = popover.classList.contains('open');
-  document.querySelectorAll('.health-popover.open').forEach(p => p.classList.remove('open'));
-  if (!wasOpen) popover.classList.add('open');
+  const popover = btn.nextElementSibling;
+  const wasOpen = popover === openPopover;
+  closeHealthPopover();
+  if (!wasOpen) {
+    popover.classList.add('open');
+    openPopover = popover;
+  }
 }
-document.addEventListener('click', () => {
-  document.querySelectorAll('.health-popover.open').forEach(p => p.classList.remove('open'));
+document.addEventListener('click', closeHealthPopover);
+// The panel is rebuilt on every live refresh; delegate instead of per-button handlers
+document.getElementById('health-panel').addEventListener('click', e => {
+  const btn = e.target.closest('.health-info-btn');
+  if (btn) toggleHealthPopover(e, btn);
 });
 
 // ─── Route Health ───
@@ -2211,7 +2390,7 @@ function renderRouteHealth() {
         '<div class="route-card-details route-card-detail-extra">' +
           row('Pairs', p.pair_count + ' (' + p.inbound_pairs + ' in, ' + p.outbound_pairs + ' out)') +
         '</div>' +
-        '<div class="route-pairs-toggle" onclick="toggleRoutePairs(this, \\'' + pairId + '\\')">' +
+        '<div class="route-pairs-toggle" data-target="' + pairId + '">' +
           '<span class="arrow">\\u25b6</span> Show pairs' +
         '</div>' +
         '<div class="route-pairs-list" id="' + pairId + '">' + pairsHtml + '</div>' +
@@ -2255,6 +2434,11 @@ function renderRouteHealth() {
   panel.innerHTML = html;
 }
 
+document.getElementById('route-health-panel').addEventListener('click', e => {
+  const toggle = e.target.closest('.route-pairs-toggle');
+  if (toggle) toggleRoutePairs(toggle, toggle.dataset.target);
+});
+
 function toggleRoutePairs(toggle, listId) {
   const list = document.getElementById(listId);
   const isOpen = list.classList.contains('open');
@@ -2274,21 +2458,22 @@ function setChartMode(mode) {
 
 function renderLargestTx() {
   const ops = [
-    { name: 'Flyover Peg-In', data: DATA.flyover_pegins, color: '#DEFF19', field: 'value_rbtc', unit: 'RBTC' },
-    { name: 'Flyover Peg-Out', data: DATA.flyover_pegouts, color: '#F0FF96', field: 'value_rbtc', unit: 'RBTC' },
-    { name: 'PowPeg Peg-In', data: DATA.powpeg_pegins, color: '#FF9100', field: 'value_rbtc', unit: 'RBTC' },
-    { name: 'PowPeg Peg-Out', data: DATA.powpeg_pegouts, color: '#FED8A7', field: 'value_rbtc', unit: 'RBTC' },
+    { name: 'Flyover Peg-In', data: DATA.flyover_pegins, color: '#DEFF19', field: 'value_sat', unit: 'RBTC' },
+    { name: 'Flyover Peg-Out', data: DATA.flyover_pegouts, color: '#F0FF96', field: 'value_sat', unit: 'RBTC' },
+    { name: 'PowPeg Peg-In', data: DATA.powpeg_pegins, color: '#FF9100', field: 'value_sat', unit: 'RBTC' },
+    { name: 'PowPeg Peg-Out', data: DATA.powpeg_pegouts, color: '#FED8A7', field: 'value_sat', unit: 'RBTC' },
   ];
 
   let html = '';
   for (const op of ops) {
-    let largest = null;
-    for (const e of op.data) {
-      if (!largest || (e[op.field] || 0) > (largest[op.field] || 0)) largest = e;
+    const values = op.data[op.field];
+    let largest = -1;
+    for (let i = 0; i < values.length; i++) {
+      if (largest < 0 || (values[i] || 0) > (values[largest] || 0)) largest = i;
     }
-    const val = largest ? (largest[op.field] || 0) : 0;
-    const date = largest ? parseTS(largest.timestamp) : null;
-    const hash = largest ? largest.tx_hash : '';
+    const val = largest >= 0 ? values[largest] / SATS_PER_RBTC : 0;
+    const date = largest >= 0 ? parseTS(op.data.timestamp[largest]) : null;
+    const hash = largest >= 0 ? op.data.tx_hash[largest] : '';
     const explorer = 'https://rootstock.blockscout.com/tx/';
 
     html += '<div class="op-card" style="border-top-color:' + op.color + '">' +
@@ -2308,10 +2493,10 @@ function renderLargestTx() {
 
 function renderAvgTxSize() {
   const ops = [
-    { name: 'Flyover Peg-In', data: DATA.flyover_pegins, color: '#DEFF19', field: 'value_rbtc', fontColor: '#000' },
-    { name: 'Flyover Peg-Out', data: DATA.flyover_pegouts, color: '#F0FF96', field: 'value_rbtc', fontColor: '#000' },
-    { name: 'PowPeg Peg-In', data: DATA.powpeg_pegins, color: '#FF9100', field: 'value_rbtc', fontColor: '#fff' },
-    { name: 'PowPeg Peg-Out', data: DATA.powpeg_pegouts, color: '#FED8A7', field: 'value_rbtc', fontColor: '#000' },
+    { name: 'Flyover Peg-In', data: DATA.flyover_pegins, color: '#DEFF19', field: 'value_sat', fontColor: '#000' },
+    { name: 'Flyover Peg-Out', data: DATA.flyover_pegouts, color: '#F0FF96', field: 'value_sat', fontColor: '#000' },
+    { name: 'PowPeg Peg-In', data: DATA.powpeg_pegins, color: '#FF9100', field: 'value_sat', fontColor: '#fff' },
+    { name: 'PowPeg Peg-Out', data: DATA.powpeg_pegouts, color: '#FED8A7', field: 'value_sat', fontColor: '#000' },
   ];
 
   const now = Date.now();
@@ -2325,18 +2510,18 @@ function renderAvgTxSize() {
   for (const op of ops) {
     let lines = '';
     for (const period of periods) {
-      const cutoff = now - period.ms;
+      const cutoff = (now - period.ms) / 1000;
       let sum = 0, count = 0;
-      for (const e of op.data) {
-        const ts = e.timestamp;
-        if (!ts) continue;
-        const t = new Date(ts).getTime();
-        if (t >= cutoff) {
-          sum += (e[op.field] || 0);
+      const stamps = op.data.timestamp;
+      const values = op.data[op.field];
+      for (let i = 0; i < stamps.length; i++) {
+        const ts = stamps[i];
+        if (ts && ts >= cutoff) {
+          sum += (values[i] || 0);
           count++;
         }
       }
-      const avg = count > 0 ? (sum / count) : 0;
+      const avg = count > 0 ? (sum / SATS_PER_RBTC / count) : 0;
       lines += '<div style="display:flex;justify-content:space-between;align-items:baseline;margin-top:6px">' +
         '<span style="color:var(--muted);font-size:11px">' + period.label + ' (' + count + ' txs)</span>' +
         '<span style="font-size:16px;font-weight:600">' + (count > 0 ? fmtRBTC(avg) : '—') + '</span>' +
@@ -2352,6 +2537,35 @@ function renderAvgTxSize() {
   document.getElementById('avg-tx-cards').innerHTML = html;
 }
 
+// Run cb once the browser is idle (bounded), or on the next task where
+// requestIdleCallback is unsupported (Safari)
+const whenIdle = window.requestIdleCallback
+  ? cb => window.requestIdleCallback(cb, { timeout: 500 })
+  : cb => setTimeout(cb, 0);
+
+// Wrap a render function so it only runs while its section is on screen (or
+// about to be). Updates made while it's scrolled away mark it stale, and it
+// catches up when it scrolls into view.
+function lazySection(selector, render) {
+  if (typeof IntersectionObserver === 'undefined') return render;
+  let visible = false, stale = false;
+  new IntersectionObserver(entries => {
+    visible = entries[entries.length - 1].isIntersecting;
+    if (visible && stale) {
+      stale = false;
+      render();
+    }
+  }, { rootMargin: '200px' }).observe(document.querySelector(selector));
+  return () => {
+    if (visible) render();
+    else stale = true;
+  };
+}
+
+// Plotly charts and the table are the slowest sections and sit below the cards
+const updateCharts = lazySection('.chart-section', renderCharts);
+const updateTable = lazySection('.table-section', renderTable);
+
 function renderAll() {
   renderSummary();
   renderBtcLocked();
@@ -2360,16 +2574,23 @@ function renderAll() {
   renderRouteHealth();
   renderLargestTx();
   renderAvgTxSize();
-  renderCharts();
   tablePage = 0;
-  renderTable();
+  // Let the cards paint first
+  whenIdle(() => {
+    updateCharts();
+    updateTable();
+  });
 }
 
 function setPeriod(p) {
   currentPeriod = p;
   document.querySelectorAll('.period-nav button').forEach(b => b.classList.remove('active'));
   document.getElementById('btn-' + p).classList.add('active');
-  renderAll();
+  // Everything else (wallets, health, largest/avg tx, BTC locked) is all-time
+  renderSummary();
+  updateCharts();
+  tablePage = 0;
+  updateTable();
 }
 
 // ─── Live LP Data ───
@@ -2471,25 +2692,105 @@ loadData();
 </html>"""
 
 
+def _minify_template(html: str) -> str:
+    """Strip indentation, blank lines and whole-line comments from the page shell.
+
+    Deliberately conservative: line breaks are kept, so JS semicolon insertion
+    behaves as written, and only whitespace HTML collapses anyway is dropped
+    from template literals.
+    """
+    out = []
+    for line in html.split("\n"):
+        line = line.strip()
+        if not line or line.startswith("//") or (line.startswith("/*") and line.endswith("*/")):
+            continue
+        out.append(line)
+    return "\n".join(out)
+
+
+_HTML_BYTES = _minify_template(_HTML_TEMPLATE).encode("utf-8")
+
+
+# Level 6 is the usual size/CPU middle ground; mtime=0 keeps the .gz output
+# byte-identical across runs when the input hasn't changed.
+GZIP_LEVEL = 6
+
+
+@contextmanager
+def _replacing(path: str):
+    """Open a binary temp file next to path that replaces path once the block succeeds.
+
+    nginx keeps serving pages/ while fetch_loop.sh regenerates it; with a
+    rename, readers get either the old file or the new one, never a partial
+    write. On error the temp file is removed and path is left untouched.
+    """
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _write_gzip_copy(payload: bytes, path: str):
+    """Write a gzip-compressed copy of payload to path + ".gz".
+
+    nginx (gzip_static) serves the .gz file directly to clients that accept
+    gzip, so nothing is compressed per request.
+    """
+    with _replacing(path + ".gz") as f:
+        f.write(gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0))
+
+
+def write_html(path: str):
+    """Write the dashboard HTML shell (pre-encoded at import) to path, plus a .gz copy."""
+    with _replacing(path) as f:
+        f.write(_HTML_BYTES)
+    _write_gzip_copy(_HTML_BYTES, path)
+
+
+def _json_default(obj):
+    """Encode values the stdlib json module can't (orjson handles these natively)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(data, path: str):
+    """Write data as compact JSON to path, plus a .gz copy.
+
+    The payload is encoded to bytes once and the same buffer feeds both files.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+    with _replacing(path) as f:
+        f.write(payload)
+    _write_gzip_copy(payload, path)
+
+
 def main():
     print("Loading data files...")
-    flyover_pegins = load_json("flyover_pegins.json")
-    flyover_pegouts = load_json("flyover_pegouts.json")
-    flyover_pegout_refunds = load_json("flyover_pegout_refunds.json")
-    flyover_penalties = load_json("flyover_penalties.json")
-    flyover_refunds = load_json("flyover_refunds.json")
-    powpeg_pegins = load_json("powpeg_pegins.json")
-    powpeg_pegouts = load_json("powpeg_pegouts.json")
-    lp_info = load_json("flyover_lp_info.json")
-    btc_locked_stats = load_json("btc_locked_stats.json")
-    web_analytics = load_json("web_analytics.json")
-    route_health = load_json("route_health.json")
+    flyover_pegins = load_list("flyover_pegins.json")
+    flyover_pegouts = load_list("flyover_pegouts.json")
+    flyover_pegout_refunds = load_list("flyover_pegout_refunds.json")
+    flyover_penalties = load_list("flyover_penalties.json")
+    powpeg_pegins = load_list("powpeg_pegins.json")
+    powpeg_pegouts = load_list("powpeg_pegouts.json")
+    lp_info = load_dict("flyover_lp_info.json")
+    btc_locked_stats = load_dict("btc_locked_stats.json")
+    route_health = load_dict("route_health.json")
 
     print(f"  Flyover peg-ins: {len(flyover_pegins)}")
     print(f"  Flyover peg-outs: {len(flyover_pegouts)}")
     print(f"  Flyover peg-out refunds: {len(flyover_pegout_refunds)}")
     print(f"  Flyover penalties: {len(flyover_penalties)}")
-    print(f"  Flyover refunds: {len(flyover_refunds)}")
     print(f"  PowPeg peg-ins: {len(powpeg_pegins)}")
     print(f"  PowPeg peg-outs: {len(powpeg_pegouts)}")
     if lp_info:
@@ -2500,11 +2801,10 @@ def main():
     print("\nBuilding dashboard data...")
     data = build_dashboard_data(
         flyover_pegins, flyover_pegouts, flyover_pegout_refunds,
-        flyover_penalties, flyover_refunds,
+        flyover_penalties,
         powpeg_pegins, powpeg_pegouts,
         lp_info=lp_info if isinstance(lp_info, dict) else {},
         btc_locked_stats=btc_locked_stats if isinstance(btc_locked_stats, dict) else {},
-        web_analytics=web_analytics if isinstance(web_analytics, dict) else {},
         route_health=route_health if isinstance(route_health, dict) else {},
     )
 
@@ -2512,16 +2812,12 @@ def main():
     json_dir = os.path.join(PAGES_DIR, "data")
     os.makedirs(json_dir, exist_ok=True)
     json_path = os.path.join(json_dir, "dashboard.json")
-    with open(json_path, "w") as f:
-        json.dump(data, f)
-    print(f"  Data written to {json_path}")
+    write_json(data, json_path)
+    print(f"  Data written to {json_path} ({os.path.getsize(json_path) / 1024:.0f} KB)")
 
     print("Generating HTML...")
-    html = generate_html()
-
     os.makedirs(PAGES_DIR, exist_ok=True)
-    with open(OUTPUT_PATH, "w") as f:
-        f.write(html)
+    write_html(OUTPUT_PATH)
 
     print(f"  HTML written to {OUTPUT_PATH}")
     print(f"\nServe locally: cd {PAGES_DIR} && python3 -m http.server 8000")
@@ -0,0 +1,226 @@
+import unittest
+
+from generate_report import (
+    EVENT_SCHEMAS,
+    LP_RBTC_WALLET,
+    _project,
+    aggregate_periods,
+    period_keys,
+    period_label,
+    top_liquidity_provider,
+    wallet_stats,
+)
+
+
+def _pegin(tx_hash, block_number, ts):
+    return {
+        "tx_hash": tx_hash,
+        "block_number": block_number,
+        "block_timestamp": ts,
+        "value_rbtc": 0.01,
+        "to_address": "0xABC",
+    }
+
+
+class ProjectTest(unittest.TestCase):
+    def test_rows_sorted_by_block(self):
+        events = [
+            _pegin("0x2", 200, "2025-04-11T00:00:00.000000Z"),
+            _pegin("0x1", 100, "2025-04-10T00:00:00.000000Z"),
+        ]
+        columns = _project(events, *EVENT_SCHEMAS["powpeg_pegins"])
+        self.assertEqual(columns["tx_hash"], ["0x1", "0x2"])
+        self.assertEqual(columns["address"], ["0xabc", "0xabc"])
+        self.assertEqual(columns["value_sat"], [1_000_000, 1_000_000])
+
+    def test_missing_block_number_sorts_last(self):
+        events = [
+            _pegin("0x3", None, "2025-04-12T00:00:00.000000Z"),
+            _pegin("0x2", 200, "2025-04-11T00:00:00.000000Z"),
+            _pegin("0x1", 100, "2025-04-10T00:00:00.000000Z"),
+        ]
+        columns = _project(events, *EVENT_SCHEMAS["powpeg_pegins"])
+        self.assertEqual(columns["tx_hash"], ["0x1", "0x2", "0x3"])
+
+    def test_absent_block_number_sorts_last(self):
+        no_block = _pegin("0x3", None, "2025-04-12T00:00:00.000000Z")
+        del no_block["block_number"]
+        events = [
+            no_block,
+            _pegin("0x2", 200, "2025-04-11T00:00:00.000000Z"),
+            _pegin("0x1", 100, "2025-04-10T00:00:00.000000Z"),
+        ]
+        columns = _project(events, *EVENT_SCHEMAS["powpeg_pegins"])
+        self.assertEqual(columns["tx_hash"], ["0x1", "0x2", "0x3"])
+
+
+def _stream(*events):
+    """Project (timestamp, rbtc) pairs as a powpeg_pegins stream with pkeys."""
+    raw = [
+        {"tx_hash": f"0x{i}", "block_number": i, "block_timestamp": ts, "value_rbtc": rbtc, "to_address": ""}
+        for i, (ts, rbtc) in enumerate(events)
+    ]
+    return _project(raw, *EVENT_SCHEMAS["powpeg_pegins"], with_periods=True)
+
+
+class PeriodKeysTest(unittest.TestCase):
+    def test_utc_day_boundaries(self):
+        self.assertEqual(period_keys("2025-04-10T23:59:59.000000Z")[0], "2025-04-10")
+        self.assertEqual(period_keys("2025-04-11T00:00:00+00:00")[0], "2025-04-11")
+        # 23:30 at UTC-2 is already the next day in UTC
+        self.assertEqual(period_keys("2025-04-10T23:30:00-02:00")[0], "2025-04-11")
+        # Naive timestamps are taken as UTC
+        self.assertEqual(period_keys("2025-04-10T23:30:00")[0], "2025-04-10")
+
+    def test_iso_week_across_year_boundary(self):
+        self.assertEqual(
+            period_keys("2024-12-30T12:00:00.000000Z"), ["2024-12-30", "2025-W01", "2024-12", "2024-Q4"]
+        )
+        self.assertEqual(period_keys("2021-01-01T12:00:00Z")[1], "2020-W53")
+
+    def test_unparseable(self):
+        for ts in ("", None, "not a date", "2025-13-40T00:00:00Z"):
+            self.assertEqual(period_keys(ts), ["unknown"] * 4)
+
+    def test_labels(self):
+        self.assertEqual(period_label("2025-04-10"), "Apr 10, 2025")
+        self.assertEqual(period_label("2025-W01"), "W01 2025")
+        self.assertEqual(period_label("2025-04"), "Apr 2025")
+        self.assertEqual(period_label("2025-Q2"), "Q2 2025")
+        self.assertEqual(period_label("unknown"), "unknown")
+
+
+class AggregatePeriodsTest(unittest.TestCase):
+    def setUp(self):
+        self.aggregates = aggregate_periods({
+            "powpeg_pegins": _stream(
+                ("2024-12-30T01:00:00.000000Z", 0.5),
+                ("2024-12-30T23:00:00.000000Z", 0.25),
+                ("2024-12-31T10:00:00.000000Z", 0.25),
+                ("2025-01-02T10:00:00.000000Z", 1.0),
+                ("garbage", 2.0),
+            ),
+            "powpeg_pegouts": _stream(("2025-01-02T11:00:00.000000Z", 0.1)),
+        })
+
+    def test_day_buckets(self):
+        day = self.aggregates["day"]
+        self.assertEqual(day["keys"], ["2024-12-30", "2024-12-31", "2025-01-02"])
+        self.assertEqual(day["labels"], ["Dec 30, 2024", "Dec 31, 2024", "Jan 2, 2025"])
+        self.assertEqual(day["powpeg_pegins"]["count"], [2, 1, 1])
+        self.assertEqual(day["powpeg_pegins"]["volume"], [0.75, 0.25, 1.0])
+        # Streams are aligned on the union of keys, with zeros where empty
+        self.assertEqual(day["powpeg_pegouts"]["count"], [0, 0, 1])
+
+    def test_roll_up(self):
+        week, month, quarter = (self.aggregates[p] for p in ("week", "month", "quarter"))
+        self.assertEqual(week["keys"], ["2025-W01"])
+        self.assertEqual(week["powpeg_pegins"]["count"], [4])
+        self.assertEqual(week["powpeg_pegins"]["volume"], [2.0])
+        self.assertEqual(month["keys"], ["2024-12", "2025-01"])
+        self.assertEqual(month["powpeg_pegins"]["count"], [3, 1])
+        self.assertEqual(month["powpeg_pegins"]["volume"], [1.0, 1.0])
+        self.assertEqual(quarter["keys"], ["2024-Q4", "2025-Q1"])
+        self.assertEqual(quarter["powpeg_pegouts"]["count"], [0, 1])
+
+    def test_unparseable_timestamps_skipped(self):
+        for entry in self.aggregates.values():
+            self.assertNotIn("unknown", entry["keys"])
+            self.assertEqual(entry["powpeg_pegins"]["total_count"], 4)
+            self.assertEqual(entry["powpeg_pegins"]["total_volume"], 2.0)
+
+
+def _wallet_stream(*events):
+    """Project (timestamp, address) pairs as a powpeg_pegins stream with pkeys."""
+    raw = [
+        {"tx_hash": f"0x{i}", "block_number": i, "block_timestamp": ts, "value_rbtc": 0.01, "to_address": addr}
+        for i, (ts, addr) in enumerate(events)
+    ]
+    return _project(raw, *EVENT_SCHEMAS["powpeg_pegins"], with_periods=True)
+
+
+class WalletStatsTest(unittest.TestCase):
+    def test_lp_wallet_excluded(self):
+        stats = wallet_stats(
+            [_wallet_stream(
+                ("2025-04-10T00:00:00Z", "0x82A06eBdb97776a2DA4041DF8F2b2Ea8d3257852"),
+                ("2025-04-10T00:00:00Z", LP_RBTC_WALLET),
+                ("2025-04-10T00:00:00Z", "0xaaa"),
+            )],
+            [],
+        )
+        self.assertEqual(stats["unique"], {"flyover": 1, "powpeg": 0, "combined": 1})
+        self.assertEqual(stats["repeat"]["flyover"], 0)
+        self.assertEqual(stats["avg"]["day"]["flyover"], 1)
+
+    def test_wallet_across_periods(self):
+        stats = wallet_stats(
+            [
+                _wallet_stream(("2025-04-10T00:00:00Z", "0xAAA"), ("2025-05-10T00:00:00Z", "0xaaa")),
+                _wallet_stream(("2025-05-11T00:00:00Z", "0xbbb")),
+            ],
+            [_wallet_stream(("2025-05-12T00:00:00Z", "0xaaa"))],
+        )
+        self.assertEqual(stats["unique"], {"flyover": 2, "powpeg": 1, "combined": 2})
+        self.assertEqual(stats["repeat"], {"flyover": 1, "powpeg": 0, "combined": 1})
+        self.assertEqual(stats["cross_protocol"], 1)
+        # April has 0xaaa, May has 0xaaa and 0xbbb: 1.5 rounds half up
+        self.assertEqual(stats["avg"]["month"], {"flyover": 2, "powpeg": 1, "combined": 2})
+        self.assertEqual(stats["avg"]["quarter"]["flyover"], 2)
+
+    def test_empty_and_none_addresses(self):
+        stats = wallet_stats(
+            [_wallet_stream(("2025-04-10T00:00:00Z", ""), ("2025-04-10T00:00:00Z", None))],
+            [_wallet_stream()],
+        )
+        self.assertEqual(stats["unique"], {"flyover": 0, "powpeg": 0, "combined": 0})
+        self.assertEqual(stats["repeat"], {"flyover": 0, "powpeg": 0, "combined": 0})
+        self.assertEqual(stats["cross_protocol"], 0)
+        self.assertEqual(stats["avg"]["day"], {"flyover": 0, "powpeg": 0, "combined": 0})
+
+
+class TopLiquidityProviderTest(unittest.TestCase):
+    def test_most_volume_wins(self):
+        pegins = {"lp_address": ["0xa", "0xb", "0xb", "0xa"], "value_sat": [5, 2, 2, 5]}
+        penalties = {"lp_address": ["0xb"]}
+        self.assertEqual(
+            top_liquidity_provider(pegins, penalties), {"address": "0xa", "pegins": 2, "penalties": 0}
+        )
+
+    def test_tie_goes_to_first_seen(self):
+        pegins = {"lp_address": ["0xb", "0xa"], "value_sat": [3, 3]}
+        self.assertEqual(top_liquidity_provider(pegins, {"lp_address": []})["address"], "0xb")
+
+    def test_penalties_without_pegins(self):
+        pegins = {"lp_address": [], "value_sat": []}
+        penalties = {"lp_address": ["0xc", "", "0xc"]}
+        self.assertEqual(
+            top_liquidity_provider(pegins, penalties), {"address": "0xc", "pegins": 0, "penalties": 2}
+        )
+
+    def test_addresses_merged_case_insensitively(self):
+        pegins = _project(
+            [
+                {"tx_hash": "0x1", "block_number": 1, "block_timestamp": "", "value_rbtc": 1,
+                 "dest_address": "", "from_address": "0xABC"},
+                {"tx_hash": "0x2", "block_number": 2, "block_timestamp": "", "value_rbtc": 1,
+                 "dest_address": "", "from_address": "0xabc"},
+            ],
+            *EVENT_SCHEMAS["flyover_pegins"],
+        )
+        penalties = _project(
+            [{"tx_hash": "0x3", "block_number": 3, "block_timestamp": "", "penalty_rbtc": 0.1,
+              "lp_address": "0xAbC"}],
+            *EVENT_SCHEMAS["penalties"],
+        )
+        self.assertEqual(
+            top_liquidity_provider(pegins, penalties), {"address": "0xabc", "pegins": 2, "penalties": 1}
+        )
+
+    def test_no_lps(self):
+        empty = {"lp_address": [], "value_sat": []}
+        self.assertEqual(top_liquidity_provider(empty, {"lp_address": [""]}), {})
+
+
+if __name__ == "__main__":
+    unittest.main()